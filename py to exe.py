@@ -3,10 +3,28 @@ import sys
 import subprocess
 import threading
 import shutil
-import tkinter as tk
-from tkinter import filedialog, messagebox
+import time
+import glob
+import codecs
+import hashlib
+import io
+import locale
+import queue
+import shlex
+from functools import lru_cache
+import tkinter as tk  # filedialog/messagebox are imported where used, to speed up startup
 
 # -------------------- Helpers --------------------
+READ_CHUNK = 65536  # bytes per read from the PyInstaller output pipe
+LOG_DRAIN_MS = 50   # how often the GUI flushes queued log text
+MAX_LOG_LINES = 2000  # older lines are dropped from the log box
+# keys still handled by the (read-only) log box
+READONLY_KEYS = {"Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next"}
+# virtual events the log box passes on to the Text class bindings; a widget
+# binding for them outranks the catch-all <Key> one, whatever keys the
+# platform maps them to (Ctrl+C, Cmd+C, Ctrl+Insert, ...)
+READONLY_EVENTS = ("<<Copy>>", "<<SelectAll>>", "<<SelectNone>>")
+
 def ensure_pyinstaller(log_fn):
     """Install pyinstaller via pip if not present."""
     try:
@@ -23,23 +41,129 @@ def ensure_pyinstaller(log_fn):
             log_fn(f"Failed to install PyInstaller: {e}\n")
             return False
 
+def _native_rmtree(path):
+    """Delete path with rm -rf on POSIX, falling back to shutil.rmtree.
+
+    Windows has no standalone rm; going through cmd.exe's rd would let
+    metacharacters such as & in the path run as commands, so the Python
+    remover is used there. shutil.rmtree is scandir-based, does not descend
+    into NTFS junctions and uses fd-based removal on POSIX.
+    """
+    if os.name != "nt":
+        try:
+            subprocess.run(["rm", "-rf", "--", path], check=False,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+    # anything left over (Windows, missing tool, locked files) goes through the
+    # Python path, which raises if it really can't be removed
+    if os.path.exists(path):
+        shutil.rmtree(path)
+
+def _rmtree_logged(path, log_fn):
+    try:
+        _native_rmtree(path)
+    except Exception as e:
+        log_fn(f"Warning: could not delete {path}: {e}\n")
+
+def _rmtree_background(path, log_fn):
+    """Delete path on a daemon thread; closing the app doesn't wait for it."""
+    threading.Thread(target=_rmtree_logged, args=(path, log_fn), daemon=True).start()
+
+def _discard_output(path, log_fn):
+    """Get a previous build output or work dir at path out of the way.
+
+    A file is simply removed; a folder is renamed to a unique sibling (near
+    instant) and deleted in the background. Returns True if anything was there.
+    """
+    if os.path.isdir(path) and not os.path.islink(path):
+        tmp = f"{path}.old-{os.getpid()}-{time.time_ns()}"
+        os.rename(path, tmp)
+        _rmtree_background(tmp, log_fn)
+        return True
+    if os.path.lexists(path):
+        os.remove(path)
+        return True
+    return False
+
+def _sweep_discarded(path, log_fn):
+    """Delete leftovers of _discard_output(path) from sessions closed mid-delete."""
+    for tmp in glob.glob(glob.escape(path) + ".old-[0-9]*-[0-9]*"):
+        _rmtree_background(tmp, log_fn)
+
+def _work_dir(src_dir, key):
+    """PyInstaller work dir for a .spec cache key, shared by rebuilds with that key.
+
+    Lives under build/ next to the script (PyInstaller's own default) rather
+    than the shared temp dir, where another user could plant it first.
+    """
+    return os.path.join(src_dir, "build", key[:16])
+
+def _spec_cache_key(src, out_name, onefile, windowed, icon):
+    """Hash of everything that ends up in the generated .spec file."""
+    options = (os.path.abspath(src), out_name, onefile, windowed, icon)
+    return hashlib.sha1(repr(options).encode("utf-8")).hexdigest()
+
+@lru_cache(maxsize=8)
+def _build_cmd(src, out_name, onefile, windowed, icon):
+    """PyInstaller argv for the given options, as a tuple (icon already validated)."""
+    cmd = [sys.executable, "-m", "PyInstaller"]
+    if onefile:
+        cmd.append("--onefile")
+    if windowed:
+        cmd.append("--noconsole")
+    # name
+    cmd.extend(["--name", out_name])
+    # icon
+    if icon:
+        cmd.extend(["--icon", icon])
+    # add the script path
+    cmd.append(src)
+    return tuple(cmd)
+
+def _read_lines(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().splitlines()
+    except OSError:
+        return []
+
 def run_subprocess(cmd, cwd, log_fn, on_done=None):
     """Run subprocess and stream stdout/stderr to log_fn."""
-    log_fn("Running: " + " ".join(cmd) + "\n\n")
+    # quote the way the user's shell would, so the line can be copy-pasted
+    shown = subprocess.list2cmdline(cmd) if os.name == "nt" else shlex.join(cmd)
+    log_fn(f"Running: {shown}\n\n")
     try:
-        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     except Exception as e:
         log_fn(f"Failed to start process: {e}\n")
         if on_done:
             on_done(False)
         return
 
-    # Stream output
-    for line in proc.stdout:
-        log_fn(line)
+    # Stream output in large chunks: os.read on a pipe blocks until data arrives
+    # and then returns everything available (up to READ_CHUNK bytes), so we get
+    # one syscall and one log_fn call per burst of output instead of one per line.
+    # The pipe is binary; each chunk is decoded once here with the same
+    # encoding text mode would use (the child writes in the locale encoding),
+    # and \r\n / \r are turned into \n like text mode did, even across chunks.
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace"),
+        translate=True)
+    fd = proc.stdout.fileno()
+    while True:
+        data = os.read(fd, READ_CHUNK)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            log_fn(text)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        log_fn(tail)
     proc.wait()
     success = (proc.returncode == 0)
-    log_fn("\nProcess finished with exit code: {}\n".format(proc.returncode))
+    log_fn(f"\nProcess finished with exit code: {proc.returncode}\n")
     if on_done:
         on_done(success)
 
@@ -57,6 +181,7 @@ class ConverterGUI(tk.Tk):
         self.out_name = tk.StringVar()
         self.onefile = tk.BooleanVar(value=True)
         self.windowed = tk.BooleanVar(value=False)
+        self._pyi_ok = None  # cached ensure_pyinstaller() result
 
         # Layout
         frm = tk.Frame(self, padx=12, pady=12)
@@ -81,34 +206,82 @@ class ConverterGUI(tk.Tk):
 
         # Log text box
         tk.Label(frm, text="Log:").grid(row=7, column=0, sticky="w")
-        self.logbox = tk.Text(frm, height=16, width=86, state="disabled", wrap="none")
+        self.logbox = tk.Text(frm, height=16, width=86, wrap="none", insertwidth=0)
+        # the box stays in "normal" state (no state toggling per log write);
+        # user edits are swallowed instead, and there is no insert cursor
+        self.logbox.bind("<Key>", self._block_edit)
+        # Tab would otherwise be swallowed too; move focus like other widgets do
+        self.logbox.bind("<Tab>", lambda e: self._move_focus(e.widget.tk_focusNext()))
+        self.logbox.bind("<<PrevWindow>>", lambda e: self._move_focus(e.widget.tk_focusPrev()))
+        for seq in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>"):
+            self.logbox.bind(seq, lambda e: "break")
+        for seq in READONLY_EVENTS:
+            self.logbox.bind(seq, lambda e: None)
         self.logbox.grid(row=8, column=0, columnspan=4, pady=(4,0))
         # scrollbar
         sb = tk.Scrollbar(frm, command=self.logbox.yview)
         sb.grid(row=8, column=4, sticky="ns")
         self.logbox['yscrollcommand'] = sb.set
 
+        # log() may be called from worker threads; text is queued and flushed
+        # to the Text widget in batches on the Tk main thread
+        self._log_q = queue.Queue()
+
         # Info label
         self.info_lbl = tk.Label(frm, text="Note: Best results on Windows. PyInstaller will create 'dist' and 'build' folders.", fg="#666")
         self.info_lbl.grid(row=9, column=0, columnspan=4, pady=(8,0), sticky="w")
 
+        # widgets disable_ui() toggles; the log box stays usable while running
+        self._togglable = [w for w in frm.winfo_children()
+                           if not isinstance(w, (tk.Text, tk.Scrollbar))]
+
+        self._drain_log()
+
     def browse_src(self):
+        from tkinter import filedialog
         f = filedialog.askopenfilename(filetypes=[("Python files", "*.py")])
         if f:
             self.src_path.set(f)
 
     def browse_icon(self):
+        from tkinter import filedialog
         f = filedialog.askopenfilename(filetypes=[("ICO files", "*.ico")])
         if f:
             self.icon_path.set(f)
 
+    def _move_focus(self, widget):
+        if widget is not None:
+            widget.focus_set()
+        return "break"
+
+    def _block_edit(self, event):
+        """Keep the log box read-only; copy/select-all come through READONLY_EVENTS."""
+        if event.keysym in READONLY_KEYS:
+            return None
+        return "break"
+
     def log(self, text):
-        self.logbox.configure(state="normal")
-        self.logbox.insert("end", text)
-        self.logbox.see("end")
-        self.logbox.configure(state="disabled")
+        self._log_q.put(text)
+
+    def _drain_log(self):
+        """Flush all queued log text into the log box with a single insert."""
+        items = []
+        try:
+            while True:
+                items.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if items:
+            self.logbox.insert("end", "".join(items))
+            # keep the widget small so inserts stay cheap on long builds
+            lines = int(self.logbox.index("end-1c").split(".")[0])
+            if lines > MAX_LOG_LINES:
+                self.logbox.delete("1.0", f"end-{MAX_LOG_LINES}l")
+            self.logbox.see("end")
+        self.after(LOG_DRAIN_MS, self._drain_log)
 
     def start_convert(self):
+        from tkinter import messagebox
         src = self.src_path.get().strip()
         if not src or not os.path.isfile(src) or not src.lower().endswith(".py"):
             messagebox.showerror("Error", "Please select a valid .py source file.")
@@ -119,21 +292,10 @@ class ConverterGUI(tk.Tk):
         threading.Thread(target=self._convert_thread, daemon=True).start()
 
     def disable_ui(self, disabled):
-        for child in self.winfo_children():
+        state = "disabled" if disabled else "normal"
+        for w in self._togglable:
             try:
-                child_state = "disabled" if disabled else "normal"
-                # don't disable text widget
-                if isinstance(child, tk.Text):
-                    continue
-                # disable direct children (frame), then iterate inner widgets
-                if isinstance(child, tk.Frame):
-                    for w in child.winfo_children():
-                        if isinstance(w, tk.Text):
-                            continue
-                        try:
-                            w.configure(state=child_state)
-                        except Exception:
-                            pass
+                w.configure(state=state)
             except Exception:
                 pass
 
@@ -146,52 +308,92 @@ class ConverterGUI(tk.Tk):
             out_name = self.out_name.get().strip() or src_name
 
             # ensure pyinstaller
-            ok = ensure_pyinstaller(self.log)
-            if not ok:
+            # only checked once per session; a failed install is retried next time
+            if not self._pyi_ok:
+                self._pyi_ok = ensure_pyinstaller(self.log)
+            if not self._pyi_ok:
                 self.log("Cannot continue without PyInstaller.\n")
                 self.disable_ui(False)
                 return
 
-            # build command
-            cmd = [sys.executable, "-m", "PyInstaller"]
-            if self.onefile.get():
-                cmd.append("--onefile")
-            if self.windowed.get():
-                cmd.append("--noconsole")
-            # name
-            cmd.extend(["--name", out_name])
-            # icon
             icon = self.icon_path.get().strip()
-            if icon and os.path.isfile(icon):
-                cmd.extend(["--icon", icon])
-            # add the script path
-            cmd.append(src)
-
-            # optional: remove previous build/dist for cleanliness
-            prev_build = os.path.join(src_dir, "build")
-            prev_dist = os.path.join(src_dir, "dist")
+            if not (icon and os.path.isfile(icon)):
+                icon = ""
+            onefile = self.onefile.get()
+            windowed = self.windowed.get()
+
+            dist = os.path.join(src_dir, "dist")
             spec_file = os.path.join(src_dir, out_name + ".spec")
-            try:
-                if os.path.exists(prev_build):
-                    shutil.rmtree(prev_build)
-                    self.log("Removed previous 'build' folder.\n")
-                if os.path.exists(prev_dist):
-                    shutil.rmtree(prev_dist)
-                    self.log("Removed previous 'dist' folder.\n")
-                if os.path.exists(spec_file):
-                    os.remove(spec_file)
-                    self.log("Removed previous .spec file.\n")
-            except Exception as e:
-                self.log(f"Warning: could not clean previous build artifacts: {e}\n")
+            key_file = spec_file + ".cachekey"
+            key = _spec_cache_key(src, out_name, onefile, windowed, icon)
+            # sidecar holds the key of the last successful build
+            prev_key = (_read_lines(key_file) or [None])[0]
+
+            # same source and options as the last successful build: rebuild from
+            # the existing .spec and its work dir so PyInstaller reuses its analysis.
+            # (No -OO / dont_write_bytecode here: -OO would strip asserts and
+            # docstrings from the user's program and change how it behaves.)
+            reuse_spec = os.path.exists(spec_file) and prev_key == key
+            if reuse_spec:
+                self.log("Options unchanged, rebuilding from existing .spec file.\n")
+                cmd = [sys.executable, "-m", "PyInstaller", spec_file]
+            else:
+                cmd = list(_build_cmd(src, out_name, onefile, windowed, icon))
+
+                try:
+                    # the old work dir belongs to other options; it is renamed aside
+                    # and deleted in the background so PyInstaller can start right
+                    # away. With the same key (spec deleted by hand) it is kept, as
+                    # it is the dir this build is about to use.
+                    if (prev_key and prev_key != key
+                            and set(prev_key) <= set("0123456789abcdef")):
+                        _discard_output(_work_dir(src_dir, prev_key), self.log)
+                    # dist is shared, so a one-file <name>.exe / <name> or a one-dir
+                    # <name>/ from other options would be left behind or collide
+                    for out in (os.path.join(dist, out_name), os.path.join(dist, out_name + ".exe")):
+                        _sweep_discarded(out, self.log)
+                        if _discard_output(out, self.log):
+                            self.log(f"Moved previous '{os.path.relpath(out, src_dir)}' aside (deleting in background).\n")
+                    if os.path.exists(key_file):
+                        os.remove(key_file)
+                    if os.path.exists(spec_file):
+                        os.remove(spec_file)
+                        self.log("Removed previous .spec file.\n")
+                except Exception as e:
+                    self.log(f"Warning: could not clean previous build artifacts: {e}\n")
+
+            # each configuration builds in its own work dir, so nothing shared has
+            # to be wiped first; on a reuse PyInstaller replaces dist/<name> itself
+            work = _work_dir(src_dir, key)
+            _sweep_discarded(work, self.log)  # only globs build/<key>.old-*
+            cmd.extend(["--noconfirm", "--workpath", work, "--distpath", dist])
+
+            def on_done(success):
+                # keep the work dir only for a good build; a failed build's work
+                # dir is dropped so the next run starts from scratch
+                try:
+                    if success:
+                        with open(key_file, "w", encoding="utf-8") as f:
+                            f.write(key + "\n")
+                    else:
+                        # renamed aside first, so a retry can't reuse a dir that is
+                        # still being deleted
+                        _discard_output(work, self.log)
+                        if os.path.exists(key_file):
+                            os.remove(key_file)
+                except OSError as e:
+                    self.log(f"Warning: could not update {key_file}: {e}\n")
+                self._on_done(success)
 
             # run pyinstaller
             self.log("Invoking PyInstaller...\n\n")
-            run_subprocess(cmd, cwd=src_dir, log_fn=self.log, on_done=self._on_done)
+            run_subprocess(cmd, cwd=src_dir, log_fn=self.log, on_done=on_done)
         except Exception as e:
             self.log(f"Unexpected error: {e}\n")
             self.disable_ui(False)
 
     def _on_done(self, success):
+        from tkinter import messagebox
         if success:
             # show where the exe is
             src = self.src_path.get().strip()